@@ -0,0 +1,67 @@
+"""
+SQLite エンジンプロファイル（legacy / tuned）の書き込み・読み出しスループット比較。
+
+    python -m benchmarks.bench_engine --writes 2000 --reads 20000 --threads 8
+
+各プロファイルで一時ファイルの DB を作り、複数スレッドから TodoService を叩く。
+結果は JSON で標準出力に出す。
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from src.app import schemas
+from src.app.db import EngineProfile, get_engine, get_session, init_db
+from src.app.services import TodoService
+
+PROFILES = {"legacy": EngineProfile.legacy(), "tuned": EngineProfile()}
+
+
+def _run(n: int, threads: int, op) -> dict:
+    errors: list[Exception] = []
+
+    def worker(i: int) -> None:
+        try:
+            op(i)
+        except Exception as e:  # database is locked など
+            errors.append(e)
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(worker, range(n)))
+    elapsed = time.perf_counter() - t0
+    return {"ops": n, "seconds": round(elapsed, 4), "ops_per_sec": round(n / elapsed, 1), "errors": len(errors)}
+
+
+def bench_profile(name: str, writes: int, reads: int, threads: int, workdir: Path) -> dict:
+    url = f"sqlite:///{workdir / f'{name}.sqlite3'}"
+    profile = PROFILES[name]
+    init_db(get_engine(url, profile))
+    svc = TodoService(session_factory=lambda: get_session(url, profile))
+    write = _run(writes, threads, lambda i: svc.create_task(schemas.TaskCreate(title=f"task {i}", tags=["bench"])))
+    ids = [t.id for t in svc.list_tasks()]
+    read = _run(reads, threads, lambda i: svc.get_task(random.choice(ids)))
+    return {"profile": name, "write": write, "read": read}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--writes", type=int, default=2000)
+    parser.add_argument("--reads", type=int, default=20000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = [bench_profile(name, args.writes, args.reads, args.threads, Path(tmp)) for name in PROFILES]
+    print(json.dumps({"threads": args.threads, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
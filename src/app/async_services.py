@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, List, Optional
+
+from . import schemas
+from .db import get_async_session
+from .services import _TABLES_SQL, STREAM_BATCH_SIZE, TaskQuery, TodoService, build_select
+
+try:
+    from sqlalchemy import text
+except Exception:  # SQLAlchemy 未導入時は常にメモリ側へ委譲
+    text = None  # type: ignore
+
+
+class AsyncTodoService:
+    """TodoService と同じ操作を AsyncSession（aiosqlite）で提供する。
+
+    メモリモードや非同期エンジンが無い場合は、同じ TodoService インスタンスへ委譲する。
+    """
+
+    def __init__(
+        self,
+        sync: TodoService,
+        session_factory: Optional[Callable[[], AbstractAsyncContextManager[Any]]] = None,
+    ) -> None:
+        self.sync = sync
+        self._session_factory = session_factory or (lambda: get_async_session())
+        self._sqlite_tables: Optional[set[str]] = None
+
+    async def _tables(self, session: Any) -> set[str]:
+        if self._sqlite_tables is None:
+            try:
+                rows = (await session.execute(text(_TABLES_SQL))).all()
+                self._sqlite_tables = {r[0] for r in rows}
+            except Exception:
+                self._sqlite_tables = set()
+        return self._sqlite_tables
+
+    async def create_task(self, payload: schemas.TaskCreate) -> schemas.TaskRead:
+        if self.sync.use_memory:
+            return self.sync.create_task(payload)
+        async with self._session_factory() as session:
+            if session is None:
+                return self.sync.create_task(payload)
+            task = schemas.Task(**payload.model_dump())  # type: ignore[arg-type, attr-defined]
+            session.add(task)
+            await session.commit()
+            await session.refresh(task)
+            return schemas.TaskRead.model_validate(task)  # type: ignore[attr-defined]
+
+    async def list_tasks(
+        self,
+        q: Optional[str] = None,
+        tag: Optional[str] = None,
+        done: Optional[bool] = None,
+        from_dt: Optional[datetime] = None,
+        to_dt: Optional[datetime] = None,
+        rank: bool = False,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[schemas.TaskRead]:
+        query = TaskQuery(q, tag, done, from_dt, to_dt, rank, after_id, limit)
+        if self.sync.use_memory:
+            return self.sync._mem_list(query)
+        async with self._session_factory() as session:
+            if session is None:
+                return self.sync._mem_list(query)
+            stmt, tag_in_sql = build_select(query, await self._tables(session))
+            rows = (await session.exec(stmt)).all()
+            if not tag_in_sql:
+                rows = [t for t in rows if tag in (t.tags or [])][:limit]
+            return [schemas.TaskRead.model_validate(t) for t in rows]  # type: ignore[attr-defined]
+
+    async def iter_tasks(
+        self,
+        q: Optional[str] = None,
+        tag: Optional[str] = None,
+        done: Optional[bool] = None,
+        from_dt: Optional[datetime] = None,
+        to_dt: Optional[datetime] = None,
+        rank: bool = False,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> AsyncIterator[schemas.TaskRead]:
+        query = TaskQuery(q, tag, done, from_dt, to_dt, rank, after_id, limit)
+        if self.sync.use_memory:
+            for t in self.sync._mem_iter(query):
+                yield schemas.TaskRead.model_validate(t)  # type: ignore[attr-defined]
+            return
+        async with self._session_factory() as session:
+            if session is None:
+                for t in self.sync._mem_iter(query):
+                    yield schemas.TaskRead.model_validate(t)  # type: ignore[attr-defined]
+                return
+            stmt, tag_in_sql = build_select(query, await self._tables(session))
+            result = await session.stream_scalars(stmt.execution_options(yield_per=batch_size))
+            sent = 0
+            async for t in result:
+                if not tag_in_sql and tag not in (t.tags or []):
+                    continue
+                if limit is not None and sent >= limit:
+                    break
+                sent += 1
+                yield schemas.TaskRead.model_validate(t)  # type: ignore[attr-defined]
+
+    async def get_task(self, id: int) -> Optional[schemas.TaskRead]:
+        if self.sync.use_memory:
+            return self.sync.get_task(id)
+        async with self._session_factory() as session:
+            if session is None:
+                return self.sync.get_task(id)
+            obj = await session.get(schemas.Task, id)
+            return schemas.TaskRead.model_validate(obj) if obj else None  # type: ignore[attr-defined]
+
+    async def update_task(self, id: int, patch: schemas.TaskUpdate) -> Optional[schemas.TaskRead]:
+        if self.sync.use_memory:
+            return self.sync.update_task(id, patch)
+        async with self._session_factory() as session:
+            if session is None:
+                return self.sync.update_task(id, patch)
+            obj = await session.get(schemas.Task, id)
+            if not obj:
+                return None
+            data = patch.model_dump(exclude_unset=True)  # type: ignore[attr-defined]
+            for k, v in data.items():
+                setattr(obj, k, v)
+            obj.updated_at = datetime.utcnow()
+            session.add(obj)
+            await session.commit()
+            await session.refresh(obj)
+            return schemas.TaskRead.model_validate(obj)  # type: ignore[attr-defined]
+
+    async def delete_task(self, id: int) -> bool:
+        if self.sync.use_memory:
+            return self.sync.delete_task(id)
+        async with self._session_factory() as session:
+            if session is None:
+                return self.sync.delete_task(id)
+            obj = await session.get(schemas.Task, id)
+            if not obj:
+                return False
+            await session.delete(obj)
+            await session.commit()
+            return True
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from contextlib import contextmanager
+import os
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Any, AsyncIterator, Iterator, Optional
 
 try:
     from sqlmodel import SQLModel, Session, create_engine
+    from sqlalchemy import event
     from sqlalchemy.engine import Engine
+    from sqlalchemy.pool import QueuePool, StaticPool
 except Exception:  # SQLModel/SQLAlchemy 未導入時のフォールバック
     SQLModel = object  # type: ignore
     Session = object  # type: ignore
@@ -16,7 +20,70 @@ except Exception:  # SQLModel/SQLAlchemy 未導入時のフォールバック
         return None
 
 
-_ENGINE_CACHE: dict[str, Optional[Engine]] = {}
+DEFAULT_DB_URL = "sqlite:///./data/app.sqlite3"
+
+
+@dataclass(frozen=True)
+class EngineProfile:
+    """SQLite 接続ごとに適用する PRAGMA とプール設定。None の PRAGMA は適用しない。"""
+
+    journal_mode: Optional[str] = "WAL"
+    synchronous: Optional[str] = "NORMAL"
+    busy_timeout_ms: Optional[int] = 5000
+    cache_size_kib: Optional[int] = 64 * 1024
+    mmap_size: Optional[int] = 256 * 1024 * 1024
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+
+    @classmethod
+    def legacy(cls) -> "EngineProfile":
+        # SQLite 既定値（ロールバックジャーナル + synchronous=FULL）
+        return cls(None, None, None, None, None)
+
+    @classmethod
+    def from_env(cls) -> "EngineProfile":
+        """DB_PROFILE=legacy|tuned と DB_* 環境変数から組み立てる。"""
+        base = cls.legacy() if os.environ.get("DB_PROFILE", "tuned") == "legacy" else cls()
+
+        def opt(name: str, default, cast=str):
+            raw = os.environ.get(name)
+            if raw is None:
+                return default
+            return None if raw.lower() in ("", "off", "none") else cast(raw)
+
+        return cls(
+            journal_mode=opt("DB_JOURNAL_MODE", base.journal_mode),
+            synchronous=opt("DB_SYNCHRONOUS", base.synchronous),
+            busy_timeout_ms=opt("DB_BUSY_TIMEOUT_MS", base.busy_timeout_ms, int),
+            cache_size_kib=opt("DB_CACHE_SIZE_KIB", base.cache_size_kib, int),
+            mmap_size=opt("DB_MMAP_SIZE", base.mmap_size, int),
+            pool_size=int(os.environ.get("DB_POOL_SIZE", base.pool_size)),
+            max_overflow=int(os.environ.get("DB_MAX_OVERFLOW", base.max_overflow)),
+            pool_timeout=float(os.environ.get("DB_POOL_TIMEOUT", base.pool_timeout)),
+        )
+
+    def pragmas(self) -> list[str]:
+        out = []
+        if self.journal_mode:
+            out.append(f"PRAGMA journal_mode={self.journal_mode}")
+        if self.synchronous:
+            out.append(f"PRAGMA synchronous={self.synchronous}")
+        if self.busy_timeout_ms is not None:
+            out.append(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+        if self.cache_size_kib is not None:
+            # 負値は KiB 指定
+            out.append(f"PRAGMA cache_size={-int(self.cache_size_kib)}")
+        if self.mmap_size is not None:
+            out.append(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        return out
+
+
+def default_db_url() -> str:
+    return os.environ.get("DATABASE_URL", DEFAULT_DB_URL)
+
+
+_ENGINE_CACHE: dict[tuple[str, EngineProfile], Optional[Engine]] = {}
 
 
 def _ensure_sqlite_dir(db_url: str) -> None:
@@ -36,25 +103,194 @@ def _ensure_sqlite_dir(db_url: str) -> None:
         p.parent.mkdir(parents=True, exist_ok=True)
 
 
-def get_engine(db_url: str = "sqlite:///./data/app.sqlite3") -> Optional[Engine]:
-    if db_url in _ENGINE_CACHE:
-        return _ENGINE_CACHE[db_url]
+def _create_sqlite_engine(db_url: str, profile: EngineProfile) -> Engine:
+    # ストリーミング応答ではスレッドプールの別スレッドから同じ接続を読むため
+    connect_args = {"check_same_thread": False}
+    if db_url in ("sqlite://", "sqlite:///:memory:"):
+        # インメモリ DB は接続ごとに別 DB になるので 1 接続を共有
+        return create_engine(db_url, echo=False, connect_args=connect_args, poolclass=StaticPool)
+    engine = create_engine(
+        db_url,
+        echo=False,
+        connect_args=connect_args,
+        poolclass=QueuePool,
+        pool_size=profile.pool_size,
+        max_overflow=profile.max_overflow,
+        pool_timeout=profile.pool_timeout,
+    )
+    _install_pragmas(engine, profile)
+    return engine
+
+
+def _install_pragmas(engine: Engine, profile: EngineProfile) -> None:
+    pragmas = profile.pragmas()
+    if not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_conn, _record) -> None:
+        cur = dbapi_conn.cursor()
+        try:
+            for pragma in pragmas:
+                cur.execute(pragma)
+        finally:
+            cur.close()
+
+
+def get_engine(db_url: str | None = None, profile: EngineProfile | None = None) -> Optional[Engine]:
+    db_url = db_url or default_db_url()
+    profile = profile or EngineProfile.from_env()
+    key = (db_url, profile)
+    if key in _ENGINE_CACHE:
+        return _ENGINE_CACHE[key]
     try:
         if not callable(create_engine):  # type: ignore[truthy-bool]
-            _ENGINE_CACHE[db_url] = None
+            _ENGINE_CACHE[key] = None
             return None
         _ensure_sqlite_dir(db_url)
-        engine = create_engine(db_url, echo=False)
-        _ENGINE_CACHE[db_url] = engine
+        if db_url.startswith("sqlite"):
+            engine = _create_sqlite_engine(db_url, profile)
+        else:
+            engine = create_engine(db_url, echo=False)
+        _ENGINE_CACHE[key] = engine
         return engine
     except Exception:
-        _ENGINE_CACHE[db_url] = None
+        _ENGINE_CACHE[key] = None
         return None
 
 
+_ASYNC_ENGINE_CACHE: dict[tuple[str, EngineProfile], Any] = {}
+
+
+def get_async_engine(db_url: str | None = None, profile: EngineProfile | None = None) -> Any:
+    """aiosqlite を使う AsyncEngine。未導入・非 SQLite の場合は None。"""
+    db_url = db_url or default_db_url()
+    profile = profile or EngineProfile.from_env()
+    key = (db_url, profile)
+    if key in _ASYNC_ENGINE_CACHE:
+        return _ASYNC_ENGINE_CACHE[key]
+    engine = None
+    try:
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        if db_url.startswith("sqlite:///") and db_url != "sqlite:///:memory:":
+            _ensure_sqlite_dir(db_url)
+            engine = create_async_engine(
+                "sqlite+aiosqlite:///" + db_url[len("sqlite:///") :],
+                echo=False,
+                pool_size=profile.pool_size,
+                max_overflow=profile.max_overflow,
+                pool_timeout=profile.pool_timeout,
+            )
+            _install_pragmas(engine.sync_engine, profile)
+    except Exception:
+        engine = None
+    _ASYNC_ENGINE_CACHE[key] = engine
+    return engine
+
+
+# task テーブルと同期する全文検索用 FTS5 仮想テーブル（trigram で部分一致も索引化）
+FTS_TABLE = "task_fts"
+
+_FTS_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    "title, description, content='task', content_rowid='id', tokenize='trigram')",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON task BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON task BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF title, description ON task BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END""",
+)
+
+
+# schemas.Task.tags (JSON) を正規化した task_tag 表。トリガーで task と同期する
+TAG_TABLE = "task_tag"
+
+_TAG_DDL = (
+    f"""CREATE TABLE IF NOT EXISTS {TAG_TABLE} (
+        tag TEXT NOT NULL,
+        task_id INTEGER NOT NULL,
+        PRIMARY KEY (tag, task_id)
+    ) WITHOUT ROWID""",
+    f"CREATE INDEX IF NOT EXISTS ix_{TAG_TABLE}_task_id ON {TAG_TABLE}(task_id)",
+    f"""CREATE TRIGGER IF NOT EXISTS {TAG_TABLE}_ai AFTER INSERT ON task BEGIN
+        INSERT OR IGNORE INTO {TAG_TABLE}(tag, task_id)
+        SELECT value, new.id FROM json_each(new.tags);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {TAG_TABLE}_ad AFTER DELETE ON task BEGIN
+        DELETE FROM {TAG_TABLE} WHERE task_id = old.id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {TAG_TABLE}_au AFTER UPDATE OF tags ON task BEGIN
+        DELETE FROM {TAG_TABLE} WHERE task_id = old.id;
+        INSERT OR IGNORE INTO {TAG_TABLE}(tag, task_id)
+        SELECT value, new.id FROM json_each(new.tags);
+    END""",
+)
+
+
+def _ensure_tag_table(engine: Engine) -> None:
+    if engine.dialect.name != "sqlite":
+        return
+    try:
+        with engine.begin() as conn:
+            exists = conn.exec_driver_sql(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (TAG_TABLE,)
+            ).first()
+            for ddl in _TAG_DDL:
+                conn.exec_driver_sql(ddl)
+            if not exists:
+                # 既存の JSON カラムから移行
+                conn.exec_driver_sql(
+                    f"INSERT OR IGNORE INTO {TAG_TABLE}(tag, task_id) "
+                    "SELECT j.value, task.id FROM task, json_each(task.tags) AS j"
+                )
+    except Exception:
+        # JSON1 非対応の SQLite ではサービス側で Python フィルタにフォールバック
+        pass
+
+
+def _ensure_fulltext(engine: Engine) -> None:
+    if engine.dialect.name != "sqlite":
+        return
+    try:
+        with engine.begin() as conn:
+            exists = conn.exec_driver_sql(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (FTS_TABLE,)
+            ).first()
+            for ddl in _FTS_DDL:
+                conn.exec_driver_sql(ddl)
+            if not exists:
+                # 既存行を取り込む
+                conn.exec_driver_sql(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+    except Exception:
+        # FTS5/trigram 非対応の SQLite では LIKE 検索にフォールバック
+        pass
+
+
+def init_db(engine: Optional[Engine]) -> None:
+    if engine is None or not hasattr(SQLModel, "metadata"):
+        return
+    from . import schemas  # noqa: F401  テーブル定義を metadata に登録
+
+    SQLModel.metadata.create_all(engine)  # type: ignore[attr-defined]
+    _ensure_tag_table(engine)
+    _ensure_fulltext(engine)
+
+
 @contextmanager
-def get_session(db_url: str | None = None) -> Iterator[Optional[Session]]:
-    engine = get_engine(db_url or "sqlite:///./data/app.sqlite3")
+def get_session(
+    db_url: str | None = None, profile: EngineProfile | None = None
+) -> Iterator[Optional[Session]]:
+    engine = get_engine(db_url, profile)
     if engine is None or Session is object:
         yield None
         return
@@ -63,3 +299,17 @@ def get_session(db_url: str | None = None) -> Iterator[Optional[Session]]:
         yield session
     finally:
         session.close()
+
+
+@asynccontextmanager
+async def get_async_session(
+    db_url: str | None = None, profile: EngineProfile | None = None
+) -> AsyncIterator[Any]:
+    engine = get_async_engine(db_url, profile)
+    if engine is None:
+        yield None
+        return
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
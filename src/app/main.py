@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any
+import os
+from typing import Any, Optional
 
 try:
     from fastapi import FastAPI
@@ -12,21 +13,29 @@ except Exception:  # FastAPI 未導入環境でもフォールバック
             )
 
 
-def create_app(use_memory: bool = False) -> "FastAPI":
+def create_app(use_memory: bool = False, use_async: Optional[bool] = None) -> "FastAPI":
     app = FastAPI(title="AI TODO Agent + Pomodoro Timer", version="0.1.0")
+    if use_async is None:
+        use_async = os.environ.get("API_ASYNC", "").lower() in ("1", "true", "yes")
 
     # DB 初期化（存在時のみ）。サービスもここでバインド
     try:
-        from .db import get_engine
-        from sqlmodel import SQLModel
+        from .db import get_engine, init_db
         engine = None if use_memory else get_engine()
-        if engine is not None and hasattr(SQLModel, "metadata"):
-            SQLModel.metadata.create_all(engine)  # type: ignore[attr-defined]
+        init_db(engine)
 
         from .services import TodoService
 
         # engine がない場合はメモリ利用
         app.state.todo_service = TodoService(use_memory=(engine is None))
+
+        if use_async:
+            from .async_services import AsyncTodoService
+            from .db import get_async_engine
+
+            # aiosqlite が無ければ同期ルートのまま
+            if engine is None or get_async_engine() is not None:
+                app.state.async_todo_service = AsyncTodoService(app.state.todo_service)
     except Exception:
         # 依存が未導入でもアプリ生成は可能に
         pass
@@ -35,7 +44,12 @@ def create_app(use_memory: bool = False) -> "FastAPI":
     try:
         from .routers import tasks, timer
 
-        app.include_router(tasks.router, prefix="/tasks", tags=["tasks"])
+        if getattr(app.state, "async_todo_service", None) is not None:
+            from .routers import tasks_async
+
+            app.include_router(tasks_async.router, prefix="/tasks", tags=["tasks"])
+        else:
+            app.include_router(tasks.router, prefix="/tasks", tags=["tasks"])
         app.include_router(timer.router, prefix="/timer", tags=["timer"])
     except Exception:
         pass
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Type
 
 try:
     from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+    from fastapi.responses import StreamingResponse
+    from pydantic import ValidationError
 except Exception:
     # 型付けのためのダミー。実行には fastapi が必須
     class APIRouter:  # type: ignore
@@ -25,10 +27,17 @@ except Exception:
         def __init__(self, status_code: int | None = None):
             ...
 
+    class StreamingResponse(Response):  # type: ignore
+        def __init__(self, content, media_type: str | None = None):
+            ...
+
     class Query:  # type: ignore
-        def __init__(self, default=None, alias: str | None = None):
+        def __init__(self, default=None, alias: str | None = None, **kwargs):
             ...
 
+    class ValidationError(Exception):  # type: ignore
+        pass
+
     class status:  # type: ignore
         HTTP_201_CREATED = 201
         HTTP_204_NO_CONTENT = 204
@@ -47,16 +56,51 @@ def get_service(request: Request) -> TodoService:
     return TodoService()
 
 
+# 次ページの after_id を返すヘッダ（ページが埋まった場合のみ）
+NEXT_CURSOR_HEADER = "X-Next-After-Id"
+
+
 @router.get("/", response_model=List[schemas.TaskRead])
 def list_tasks(
+    response: Response,
     q: Optional[str] = None,
     tag: Optional[str] = None,
     done: Optional[bool] = None,
     from_: Optional[datetime] = Query(None, alias="from"),
     to: Optional[datetime] = None,
+    rank: bool = False,
+    after_id: Optional[int] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
     svc: TodoService = Depends(get_service),
 ) -> List[schemas.TaskRead]:
-    return svc.list_tasks(q=q, tag=tag, done=done, from_dt=from_, to_dt=to)
+    items = svc.list_tasks(
+        q=q, tag=tag, done=done, from_dt=from_, to_dt=to, rank=rank, after_id=after_id, limit=limit
+    )
+    if limit is not None and len(items) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = str(items[-1].id)
+    return items
+
+
+@router.get("/stream")
+def stream_tasks(
+    q: Optional[str] = None,
+    tag: Optional[str] = None,
+    done: Optional[bool] = None,
+    from_: Optional[datetime] = Query(None, alias="from"),
+    to: Optional[datetime] = None,
+    after_id: Optional[int] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    svc: TodoService = Depends(get_service),
+) -> StreamingResponse:
+    """NDJSON で 1 行 1 タスクを逐次返す（エクスポート用、メモリ使用量は一定）。"""
+
+    def lines() -> Iterator[str]:
+        for t in svc.iter_tasks(
+            q=q, tag=tag, done=done, from_dt=from_, to_dt=to, after_id=after_id, limit=limit
+        ):
+            yield t.model_dump_json() + "\n"  # type: ignore[attr-defined]
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 @router.post("/", response_model=schemas.TaskRead, status_code=status.HTTP_201_CREATED)
@@ -64,6 +108,56 @@ def create_task(payload: schemas.TaskCreate, svc: TodoService = Depends(get_serv
     return svc.create_task(payload)
 
 
+def _validate_items(
+    items: Sequence[Any], model: Type[Any]
+) -> Tuple[List[Any], List[int], Dict[int, schemas.BulkItemResult]]:
+    """要素ごとに検証し、不正な要素は一括処理から外して結果に残す。"""
+    valid: List[Any] = []
+    positions: List[int] = []
+    errors: Dict[int, schemas.BulkItemResult] = {}
+    for i, raw in enumerate(items):
+        try:
+            valid.append(model.model_validate(raw))
+            positions.append(i)
+        except ValidationError as e:
+            errors[i] = schemas.BulkItemResult(index=i, ok=False, error=str(e))
+    return valid, positions, errors
+
+
+def _merge_results(
+    results: List[schemas.BulkItemResult],
+    positions: List[int],
+    errors: Dict[int, schemas.BulkItemResult],
+) -> List[schemas.BulkItemResult]:
+    for r in results:
+        r.index = positions[r.index]
+        errors[r.index] = r
+    return [errors[i] for i in sorted(errors)]
+
+
+@router.post("/bulk", response_model=List[schemas.BulkItemResult])
+def create_tasks_bulk(
+    payload: List[Dict[str, Any]], svc: TodoService = Depends(get_service)
+) -> List[schemas.BulkItemResult]:
+    valid, positions, errors = _validate_items(payload, schemas.TaskCreate)
+    return _merge_results(svc.create_tasks(valid), positions, errors)
+
+
+@router.patch("/bulk", response_model=List[schemas.BulkItemResult])
+def update_tasks_bulk(
+    payload: List[Dict[str, Any]], svc: TodoService = Depends(get_service)
+) -> List[schemas.BulkItemResult]:
+    valid, positions, errors = _validate_items(payload, schemas.TaskBulkUpdate)
+    return _merge_results(svc.update_tasks(valid), positions, errors)
+
+
+@router.delete("/bulk", response_model=List[schemas.BulkItemResult])
+def delete_tasks_bulk(
+    ids: List[int], svc: TodoService = Depends(get_service)
+) -> List[schemas.BulkItemResult]:
+    return svc.delete_tasks(ids)
+
+
 @router.get("/{id}", response_model=schemas.TaskRead)
 def get_task(id: int, svc: TodoService = Depends(get_service)) -> schemas.TaskRead:
     t = svc.get_task(id)
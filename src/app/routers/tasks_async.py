@@ -0,0 +1,133 @@
+# package: app.routers
+"""tasks.py と同じ API を async ハンドラで提供する（create_app(use_async=True) で有効）。"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+try:
+    from starlette.concurrency import run_in_threadpool
+except Exception:
+    async def run_in_threadpool(func, *args, **kwargs):  # type: ignore
+        return func(*args, **kwargs)
+
+from .. import schemas
+from ..async_services import AsyncTodoService
+from .tasks import (
+    NEXT_CURSOR_HEADER,
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    StreamingResponse,
+    _merge_results,
+    _validate_items,
+    status,
+)
+
+router = APIRouter()
+
+
+def get_async_service(request: Request) -> AsyncTodoService:
+    return request.app.state.async_todo_service  # type: ignore[attr-defined]
+
+
+@router.get("/", response_model=List[schemas.TaskRead])
+async def list_tasks(
+    response: Response,
+    q: Optional[str] = None,
+    tag: Optional[str] = None,
+    done: Optional[bool] = None,
+    from_: Optional[datetime] = Query(None, alias="from"),
+    to: Optional[datetime] = None,
+    rank: bool = False,
+    after_id: Optional[int] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    svc: AsyncTodoService = Depends(get_async_service),
+) -> List[schemas.TaskRead]:
+    items = await svc.list_tasks(
+        q=q, tag=tag, done=done, from_dt=from_, to_dt=to, rank=rank, after_id=after_id, limit=limit
+    )
+    if limit is not None and len(items) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = str(items[-1].id)
+    return items
+
+
+@router.get("/stream")
+async def stream_tasks(
+    q: Optional[str] = None,
+    tag: Optional[str] = None,
+    done: Optional[bool] = None,
+    from_: Optional[datetime] = Query(None, alias="from"),
+    to: Optional[datetime] = None,
+    after_id: Optional[int] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    svc: AsyncTodoService = Depends(get_async_service),
+) -> StreamingResponse:
+    async def lines() -> AsyncIterator[str]:
+        async for t in svc.iter_tasks(
+            q=q, tag=tag, done=done, from_dt=from_, to_dt=to, after_id=after_id, limit=limit
+        ):
+            yield t.model_dump_json() + "\n"  # type: ignore[attr-defined]
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.post("/", response_model=schemas.TaskRead, status_code=status.HTTP_201_CREATED)
+async def create_task(
+    payload: schemas.TaskCreate, svc: AsyncTodoService = Depends(get_async_service)
+) -> schemas.TaskRead:
+    return await svc.create_task(payload)
+
+
+# 一括処理は executemany の同期実装をスレッドプールで実行する
+@router.post("/bulk", response_model=List[schemas.BulkItemResult])
+async def create_tasks_bulk(
+    payload: List[Dict[str, Any]], svc: AsyncTodoService = Depends(get_async_service)
+) -> List[schemas.BulkItemResult]:
+    valid, positions, errors = _validate_items(payload, schemas.TaskCreate)
+    return _merge_results(await run_in_threadpool(svc.sync.create_tasks, valid), positions, errors)
+
+
+@router.patch("/bulk", response_model=List[schemas.BulkItemResult])
+async def update_tasks_bulk(
+    payload: List[Dict[str, Any]], svc: AsyncTodoService = Depends(get_async_service)
+) -> List[schemas.BulkItemResult]:
+    valid, positions, errors = _validate_items(payload, schemas.TaskBulkUpdate)
+    return _merge_results(await run_in_threadpool(svc.sync.update_tasks, valid), positions, errors)
+
+
+@router.delete("/bulk", response_model=List[schemas.BulkItemResult])
+async def delete_tasks_bulk(
+    ids: List[int], svc: AsyncTodoService = Depends(get_async_service)
+) -> List[schemas.BulkItemResult]:
+    return await run_in_threadpool(svc.sync.delete_tasks, ids)
+
+
+@router.get("/{id}", response_model=schemas.TaskRead)
+async def get_task(id: int, svc: AsyncTodoService = Depends(get_async_service)) -> schemas.TaskRead:
+    t = await svc.get_task(id)
+    if not t:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return t
+
+
+@router.patch("/{id}", response_model=schemas.TaskRead)
+async def update_task(
+    id: int, payload: schemas.TaskUpdate, svc: AsyncTodoService = Depends(get_async_service)
+) -> schemas.TaskRead:
+    t = await svc.update_task(id, payload)
+    if not t:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return t
+
+
+@router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_task(id: int, svc: AsyncTodoService = Depends(get_async_service)) -> Response:
+    ok = await svc.delete_task(id)
+    if not ok:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -5,7 +5,7 @@ from typing import Literal, Optional
 
 try:
     from sqlmodel import Field, SQLModel
-    from sqlalchemy import Column
+    from sqlalchemy import Column, String
     from sqlalchemy.dialects.sqlite import JSON
     SQLMODEL_AVAILABLE = True
 except Exception:
@@ -20,6 +20,8 @@ except Exception:
     class JSON:  # type: ignore
         pass
 
+    String = None  # type: ignore
+
     SQLMODEL_AVAILABLE = False
 
 
@@ -31,7 +33,8 @@ class TaskBase(SQLModel):
     title: str
     description: Optional[str] = None
     due_at: Optional[datetime] = None
-    priority: Literal["low", "normal", "high"] = "normal"
+    # Literal は SQLModel が型推論できないため列型を明示
+    priority: Literal["low", "normal", "high"] = Field(default="normal", sa_type=String)  # type: ignore[arg-type]
     # SQLModel あり: JSON カラムで保持 / なし: Pydantic リスト
     if SQLMODEL_AVAILABLE:
         tags: list[str] = Field(default_factory=list, sa_column=Column(JSON))  # type: ignore[arg-type]
@@ -63,3 +66,15 @@ class TaskUpdate(SQLModel):
     priority: Optional[Literal["low", "normal", "high"]] = None
     tags: Optional[list[str]] = None
     done: Optional[bool] = None
+
+
+class TaskBulkUpdate(TaskUpdate):
+    id: int
+
+
+class BulkItemResult(SQLModel):
+    # 入力配列内の位置。失敗しても他の要素は処理される
+    index: int
+    id: Optional[int] = None
+    ok: bool = True
+    error: Optional[str] = None
@@ -1,20 +1,109 @@
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right, insort
 from contextlib import AbstractContextManager
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Callable, Iterable, List, Optional
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence
 
 from . import schemas
-from .db import get_session
+from .db import FTS_TABLE, TAG_TABLE, get_session
 from .utils.timecycle import PomodoroCycle, PomodoroConfig
 
 try:
     from sqlmodel import Session, select
+    from sqlalchemy import column, delete, func, insert, literal_column, table, text, update
     SQLMODEL_AVAILABLE = True
 except Exception:
     Session = object  # type: ignore
     SQLMODEL_AVAILABLE = False
 
+# trigram 転置インデックスで扱える最小クエリ長（FTS5 trigram と同じ）
+_NGRAM = 3
+
+
+def _ngrams(text: str) -> set[str]:
+    return {text[i : i + _NGRAM] for i in range(len(text) - _NGRAM + 1)}
+
+
+def _task_ngrams(task: schemas.Task) -> set[str]:
+    # title と description を別々に分割し、境界をまたぐ n-gram を作らない
+    return _ngrams(task.title.lower()) | _ngrams((task.description or "").lower())
+
+
+def _match_score(task: schemas.Task, ql: str) -> int:
+    return 2 * task.title.lower().count(ql) + (task.description or "").lower().count(ql)
+
+
+def _fts_phrase(q: str) -> str:
+    return '"' + q.replace('"', '""') + '"'
+
+
+# ストリーミング時にサーバサイドカーソルから一度に取り出す行数
+STREAM_BATCH_SIZE = 500
+# 一括処理で IN 句に渡す id 数の上限（SQLite のバインド変数上限対策）
+BULK_CHUNK_SIZE = 500
+
+
+def _chunks(seq: Sequence, size: int = BULK_CHUNK_SIZE) -> Iterator[Sequence]:
+    for i in range(0, len(seq), size):
+        yield seq[i : i + size]
+
+
+@dataclass(frozen=True)
+class TaskQuery:
+    q: Optional[str] = None
+    tag: Optional[str] = None
+    done: Optional[bool] = None
+    from_dt: Optional[datetime] = None
+    to_dt: Optional[datetime] = None
+    rank: bool = False
+    # キーセットページング: id 昇順で after_id より後ろを最大 limit 件
+    after_id: Optional[int] = None
+    limit: Optional[int] = None
+
+
+_TABLES_SQL = "SELECT name FROM sqlite_master WHERE type='table'"
+
+
+def build_select(query: TaskQuery, tables: set[str]):
+    """SELECT を組み立てる。タグ条件を SQL 側で適用できたかを併せて返す。
+
+    tables は DB に存在するテーブル名（FTS/タグ表が無ければ LIKE/Python フィルタ）。
+    """
+    stmt = select(schemas.Task)
+    q, tag = query.q, query.tag
+    if q and len(q) >= _NGRAM and FTS_TABLE in tables:
+        fts = table(FTS_TABLE, column("rowid"), column(FTS_TABLE))
+        stmt = stmt.join(fts, fts.c.rowid == schemas.Task.id).where(
+            fts.c[FTS_TABLE].op("MATCH")(_fts_phrase(q))
+        )
+        if query.rank:
+            stmt = stmt.order_by(func.bm25(literal_column(FTS_TABLE)))
+    elif q:
+        like = f"%{q}%"
+        stmt = stmt.where(
+            (schemas.Task.title.ilike(like))
+            | (schemas.Task.description.ilike(like))  # type: ignore[arg-type]
+        )
+    if query.done is not None:
+        stmt = stmt.where(schemas.Task.done == bool(query.done))
+    if query.from_dt is not None:
+        stmt = stmt.where(schemas.Task.due_at >= query.from_dt)
+    if query.to_dt is not None:
+        stmt = stmt.where(schemas.Task.due_at <= query.to_dt)
+    tag_in_sql = bool(tag) and TAG_TABLE in tables
+    if tag_in_sql:
+        tt = table(TAG_TABLE, column("tag"), column("task_id"))
+        stmt = stmt.join(tt, tt.c.task_id == schemas.Task.id).where(tt.c.tag == tag)
+    if query.after_id is not None:
+        stmt = stmt.where(schemas.Task.id > query.after_id)
+    stmt = stmt.order_by(schemas.Task.id)
+    if query.limit is not None and (tag_in_sql or not tag):
+        stmt = stmt.limit(query.limit)
+    return stmt, tag_in_sql or not tag
+
 
 class TodoService:
     def __init__(
@@ -26,6 +115,61 @@ class TodoService:
         self._use_memory = bool(use_memory) or not SQLMODEL_AVAILABLE
         self._store: dict[int, schemas.Task] = {}
         self._next_id = 1
+        # メモリモード用の二次インデックス（create/update/delete で差分更新）
+        self._tag_index: dict[str, set[int]] = {}
+        self._done_index: dict[bool, set[int]] = {True: set(), False: set()}
+        self._due_index: list[tuple[datetime, int]] = []  # (due_at, id) 昇順
+        self._text_index: dict[str, set[int]] = {}  # trigram -> ids
+        self._sqlite_tables: Optional[set[str]] = None
+
+    @property
+    def use_memory(self) -> bool:
+        return self._use_memory
+
+    # ---- In-memory index helpers ----
+    def _index_add(self, task: schemas.Task) -> None:
+        tid = task.id
+        for tag in set(task.tags or []):
+            self._tag_index.setdefault(tag, set()).add(tid)
+        self._done_index[bool(task.done)].add(tid)
+        if task.due_at is not None:
+            insort(self._due_index, (task.due_at, tid))
+        for gram in _task_ngrams(task):
+            self._text_index.setdefault(gram, set()).add(tid)
+
+    def _index_remove(self, task: schemas.Task) -> None:
+        tid = task.id
+        for tag in set(task.tags or []):
+            ids = self._tag_index.get(tag)
+            if ids is not None:
+                ids.discard(tid)
+                if not ids:
+                    del self._tag_index[tag]
+        self._done_index[bool(task.done)].discard(tid)
+        if task.due_at is not None:
+            key = (task.due_at, tid)
+            i = bisect_left(self._due_index, key)
+            if i < len(self._due_index) and self._due_index[i] == key:
+                del self._due_index[i]
+        for gram in _task_ngrams(task):
+            ids = self._text_index.get(gram)
+            if ids is not None:
+                ids.discard(tid)
+                if not ids:
+                    del self._text_index[gram]
+
+    def _due_range_ids(self, from_dt: Optional[datetime], to_dt: Optional[datetime]) -> set[int]:
+        lo = bisect_left(self._due_index, (from_dt,)) if from_dt else 0
+        hi = (
+            bisect_right(self._due_index, (to_dt, float("inf")))
+            if to_dt
+            else len(self._due_index)
+        )
+        return {tid for _, tid in self._due_index[lo:hi]}
+
+    def _text_ids(self, ql: str) -> set[int]:
+        postings = sorted((self._text_index.get(g, set()) for g in _ngrams(ql)), key=len)
+        return postings[0].intersection(*postings[1:])
 
     # ---- In-memory helpers ----
     def _mem_create(self, payload: schemas.TaskCreate) -> schemas.TaskRead:
@@ -42,35 +186,48 @@ class TodoService:
             updated_at=now,
         )
         self._store[self._next_id] = task
+        self._index_add(task)
         self._next_id += 1
         return schemas.TaskRead.model_validate(task)  # type: ignore[attr-defined]
 
-    def _mem_list(
-        self,
-        q: Optional[str],
-        tag: Optional[str],
-        done: Optional[bool],
-        from_dt: Optional[datetime],
-        to_dt: Optional[datetime],
-    ) -> List[schemas.TaskRead]:
-        items: Iterable[schemas.Task] = self._store.values()
-        if q:
-            ql = q.lower()
-            items = [
+    def _mem_iter(self, query: TaskQuery) -> Iterator[schemas.Task]:
+        # 候補 id 集合を小さい順に積集合し、全件走査を避ける
+        candidates: list[set[int]] = []
+        ql = query.q.lower() if query.q else ""
+        if len(ql) >= _NGRAM:
+            candidates.append(self._text_ids(ql))
+        if query.tag:
+            candidates.append(self._tag_index.get(query.tag, set()))
+        if query.done is not None:
+            candidates.append(self._done_index[bool(query.done)])
+        if query.from_dt or query.to_dt:
+            candidates.append(self._due_range_ids(query.from_dt, query.to_dt))
+
+        after = query.after_id or 0
+        items: Iterable[schemas.Task]
+        if candidates:
+            candidates.sort(key=len)
+            ids = sorted(candidates[0].intersection(*candidates[1:]))
+            items = (self._store[i] for i in ids[bisect_right(ids, after) :])
+        elif after:
+            # id は単調増加なので after_id 以降だけを辿る
+            items = (self._store[i] for i in range(after + 1, self._next_id) if i in self._store)
+        else:
+            items = self._store.values()
+        if ql:
+            # trigram は候補の絞り込みのみ。部分一致の最終判定はここで行う
+            items = (
                 t
                 for t in items
                 if ql in t.title.lower()
                 or (t.description or "").lower().find(ql) >= 0
-            ]
-        if tag:
-            items = [t for t in items if tag in (t.tags or [])]
-        if done is not None:
-            items = [t for t in items if bool(t.done) is bool(done)]
-        if from_dt:
-            items = [t for t in items if t.due_at and t.due_at >= from_dt]
-        if to_dt:
-            items = [t for t in items if t.due_at and t.due_at <= to_dt]
-        return [schemas.TaskRead.model_validate(t) for t in items]  # type: ignore[attr-defined]
+            )
+            if query.rank:
+                items = sorted(items, key=lambda t: _match_score(t, ql), reverse=True)
+        return islice(items, query.limit)
+
+    def _mem_list(self, query: TaskQuery) -> List[schemas.TaskRead]:
+        return [schemas.TaskRead.model_validate(t) for t in self._mem_iter(query)]  # type: ignore[attr-defined]
 
     def _mem_get(self, id: int) -> Optional[schemas.Task]:
         return self._store.get(id)
@@ -80,13 +237,29 @@ class TodoService:
         if not t:
             return None
         data = patch.model_dump(exclude_unset=True)  # type: ignore[attr-defined]
+        self._index_remove(t)
         for k, v in data.items():
             setattr(t, k, v)
         t.updated_at = datetime.utcnow()
+        self._index_add(t)
         return schemas.TaskRead.model_validate(t)  # type: ignore[attr-defined]
 
     def _mem_delete(self, id: int) -> bool:
-        return self._store.pop(id, None) is not None
+        t = self._store.pop(id, None)
+        if t is None:
+            return False
+        self._index_remove(t)
+        return True
+
+    def _tables(self, session: Session) -> set[str]:
+        # init_db が作る補助テーブル（FTS/タグ）の有無を一度だけ確認する
+        if self._sqlite_tables is None:
+            try:
+                rows = session.exec(text(_TABLES_SQL)).all()  # type: ignore[call-overload]
+                self._sqlite_tables = {r[0] for r in rows}
+            except Exception:
+                self._sqlite_tables = set()
+        return self._sqlite_tables
 
     # ---- Public API ----
     def create_task(self, payload: schemas.TaskCreate) -> schemas.TaskRead:
@@ -102,6 +275,16 @@ class TodoService:
             session.refresh(task)
             return schemas.TaskRead.model_validate(task)  # type: ignore[attr-defined]
 
+    def _select(self, session: Session, query: TaskQuery):
+        return build_select(query, self._tables(session))
+
+    def _iter_rows(self, session: Session, query: TaskQuery, batch_size: int) -> Iterator[schemas.Task]:
+        stmt, tag_in_sql = self._select(session, query)
+        rows: Iterable[schemas.Task] = session.exec(stmt.execution_options(yield_per=batch_size))
+        if not tag_in_sql:
+            rows = (t for t in rows if query.tag in (t.tags or []))
+        return islice(rows, query.limit)
+
     def list_tasks(
         self,
         q: Optional[str] = None,
@@ -109,29 +292,48 @@ class TodoService:
         done: Optional[bool] = None,
         from_dt: Optional[datetime] = None,
         to_dt: Optional[datetime] = None,
+        rank: bool = False,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
     ) -> List[schemas.TaskRead]:
+        query = TaskQuery(q, tag, done, from_dt, to_dt, rank, after_id, limit)
         if self._use_memory:
-            return self._mem_list(q, tag, done, from_dt, to_dt)
+            return self._mem_list(query)
         with self._session_factory() as session:
             if session is None:
-                return self._mem_list(q, tag, done, from_dt, to_dt)
-            stmt = select(schemas.Task)
-            if q:
-                like = f"%{q}%"
-                stmt = stmt.where(
-                    (schemas.Task.title.ilike(like))
-                    | (schemas.Task.description.ilike(like))  # type: ignore[arg-type]
-                )
-            if done is not None:
-                stmt = stmt.where(schemas.Task.done == bool(done))
-            if from_dt is not None:
-                stmt = stmt.where(schemas.Task.due_at >= from_dt)
-            if to_dt is not None:
-                stmt = stmt.where(schemas.Task.due_at <= to_dt)
-            # Note: SQLite JSON contains for tag is non-trivial; skip for robustness
+                return self._mem_list(query)
+            stmt, tag_in_sql = self._select(session, query)
             rows = session.exec(stmt).all()
+            if not tag_in_sql:
+                rows = [t for t in rows if tag in (t.tags or [])][:limit]
             return [schemas.TaskRead.model_validate(t) for t in rows]  # type: ignore[attr-defined]
 
+    def iter_tasks(
+        self,
+        q: Optional[str] = None,
+        tag: Optional[str] = None,
+        done: Optional[bool] = None,
+        from_dt: Optional[datetime] = None,
+        to_dt: Optional[datetime] = None,
+        rank: bool = False,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[schemas.TaskRead]:
+        """list_tasks と同じ条件で 1 件ずつ返す。DB モードではカーソルから逐次取得する。"""
+        query = TaskQuery(q, tag, done, from_dt, to_dt, rank, after_id, limit)
+        if self._use_memory:
+            for t in self._mem_iter(query):
+                yield schemas.TaskRead.model_validate(t)  # type: ignore[attr-defined]
+            return
+        with self._session_factory() as session:
+            if session is None:
+                for t in self._mem_iter(query):
+                    yield schemas.TaskRead.model_validate(t)  # type: ignore[attr-defined]
+                return
+            for t in self._iter_rows(session, query, batch_size):
+                yield schemas.TaskRead.model_validate(t)  # type: ignore[attr-defined]
+
     def get_task(self, id: int) -> Optional[schemas.TaskRead]:
         if self._use_memory:
             t = self._mem_get(id)
@@ -174,6 +376,109 @@ class TodoService:
             session.commit()
             return True
 
+    # ---- Bulk API（1 トランザクション、要素ごとのエラーは結果に載せる） ----
+    def create_tasks(self, payloads: Sequence[schemas.TaskCreate]) -> List[schemas.BulkItemResult]:
+        if not self._use_memory:
+            with self._session_factory() as session:
+                if session is not None:
+                    return self._db_create_many(session, payloads)
+        results = []
+        for i, p in enumerate(payloads):
+            try:
+                results.append(schemas.BulkItemResult(index=i, id=self._mem_create(p).id))
+            except Exception as e:
+                results.append(schemas.BulkItemResult(index=i, ok=False, error=str(e)))
+        return results
+
+    def update_tasks(self, patches: Sequence[schemas.TaskBulkUpdate]) -> List[schemas.BulkItemResult]:
+        if not self._use_memory:
+            with self._session_factory() as session:
+                if session is not None:
+                    return self._db_update_many(session, patches)
+        results = []
+        for i, p in enumerate(patches):
+            patch = schemas.TaskUpdate(**p.model_dump(exclude_unset=True, exclude={"id"}))  # type: ignore[attr-defined]
+            ok = self._mem_update(p.id, patch) is not None
+            results.append(_bulk_result(i, p.id, ok))
+        return results
+
+    def delete_tasks(self, ids: Sequence[int]) -> List[schemas.BulkItemResult]:
+        if not self._use_memory:
+            with self._session_factory() as session:
+                if session is not None:
+                    return self._db_delete_many(session, ids)
+        return [_bulk_result(i, tid, self._mem_delete(tid)) for i, tid in enumerate(ids)]
+
+    def _db_create_many(
+        self, session: Session, payloads: Sequence[schemas.TaskCreate]
+    ) -> List[schemas.BulkItemResult]:
+        now = datetime.utcnow()
+        rows = [
+            {**p.model_dump(), "created_at": now, "updated_at": now}  # type: ignore[attr-defined]
+            for p in payloads
+        ]
+        if not rows:
+            return []
+        stmt = insert(schemas.Task).returning(schemas.Task.id, sort_by_parameter_order=True)
+        try:
+            ids = list(session.scalars(stmt, rows))
+            session.commit()
+            return [schemas.BulkItemResult(index=i, id=tid) for i, tid in enumerate(ids)]
+        except Exception:
+            session.rollback()
+        # executemany が失敗した場合のみ、行ごとの SAVEPOINT で成否を切り分ける
+        results = []
+        for i, row in enumerate(rows):
+            try:
+                with session.begin_nested():
+                    tid = session.scalars(stmt, [row]).one()
+                results.append(schemas.BulkItemResult(index=i, id=tid))
+            except Exception as e:
+                results.append(schemas.BulkItemResult(index=i, ok=False, error=str(e)))
+        session.commit()
+        return results
+
+    def _existing_ids(self, session: Session, ids: Sequence[int]) -> set[int]:
+        found: set[int] = set()
+        for chunk in _chunks(list(set(ids))):
+            found.update(session.scalars(select(schemas.Task.id).where(schemas.Task.id.in_(chunk))))  # type: ignore[attr-defined]
+        return found
+
+    def _db_update_many(
+        self, session: Session, patches: Sequence[schemas.TaskBulkUpdate]
+    ) -> List[schemas.BulkItemResult]:
+        found = self._existing_ids(session, [p.id for p in patches])
+        now = datetime.utcnow()
+        rows = [
+            {**p.model_dump(exclude_unset=True), "id": p.id, "updated_at": now}  # type: ignore[attr-defined]
+            for p in patches
+            if p.id in found
+        ]
+        if rows:
+            # 主キー指定の ORM bulk UPDATE（executemany、refresh なし）
+            session.execute(update(schemas.Task), rows)
+            session.commit()
+        return [_bulk_result(i, p.id, p.id in found) for i, p in enumerate(patches)]
+
+    def _db_delete_many(self, session: Session, ids: Sequence[int]) -> List[schemas.BulkItemResult]:
+        found = self._existing_ids(session, ids)
+        for chunk in _chunks(list(found)):
+            session.execute(delete(schemas.Task).where(schemas.Task.id.in_(chunk)))  # type: ignore[attr-defined]
+        session.commit()
+        # 重複 id は最初の 1 件のみ成功扱い
+        seen: set[int] = set()
+        results = []
+        for i, tid in enumerate(ids):
+            results.append(_bulk_result(i, tid, tid in found and tid not in seen))
+            seen.add(tid)
+        return results
+
+
+def _bulk_result(index: int, id: int, ok: bool) -> schemas.BulkItemResult:
+    if ok:
+        return schemas.BulkItemResult(index=index, id=id)
+    return schemas.BulkItemResult(index=index, id=id, ok=False, error="Task not found")
+
 
 class TimerService:
     def __init__(self, config: PomodoroConfig | None = None) -> None:
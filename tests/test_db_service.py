@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import pytest
+
+from src.app import schemas
+from src.app.db import TAG_TABLE, EngineProfile, get_engine, get_session, init_db
+from src.app.services import TodoService
+
+
+@pytest.fixture()
+def db_url(tmp_path) -> str:
+    url = f"sqlite:///{tmp_path / 'test.sqlite3'}"
+    init_db(get_engine(url))
+    return url
+
+
+@pytest.fixture()
+def svc(db_url: str) -> TodoService:
+    return TodoService(session_factory=lambda: get_session(db_url))
+
+
+def test_db_fulltext_search(svc: TodoService):
+    a = svc.create_task(schemas.TaskCreate(title="write report", description="quarterly"))
+    b = svc.create_task(schemas.TaskCreate(title="Report review", description="report draft report"))
+    svc.create_task(schemas.TaskCreate(title="牛乳を買う"))
+
+    assert sorted(t.id for t in svc.list_tasks(q="REPORT")) == [a.id, b.id]
+    assert [t.id for t in svc.list_tasks(q="report", rank=True)][0] == b.id
+    assert [t.title for t in svc.list_tasks(q="牛乳")] == ["牛乳を買う"]
+    assert [t.title for t in svc.list_tasks(q="牛乳を買")] == ["牛乳を買う"]
+
+    svc.update_task(a.id, schemas.TaskUpdate(title="write summary", description=None))
+    assert [t.id for t in svc.list_tasks(q="report")] == [b.id]
+    svc.delete_task(b.id)
+    assert svc.list_tasks(q="report") == []
+
+
+def test_db_tag_filter(svc: TodoService, db_url: str):
+    a = svc.create_task(schemas.TaskCreate(title="a", tags=["work"]))
+    b = svc.create_task(schemas.TaskCreate(title="b", tags=["work", "home"]))
+    c = svc.create_task(schemas.TaskCreate(title="c", tags=["home"], done=True))
+
+    assert sorted(t.id for t in svc.list_tasks(tag="work")) == [a.id, b.id]
+    assert [t.id for t in svc.list_tasks(tag="home", done=True)] == [c.id]
+    with get_engine(db_url).connect() as conn:
+        rows = conn.exec_driver_sql(f"SELECT tag, task_id FROM {TAG_TABLE} ORDER BY task_id, tag").all()
+    assert [tuple(r) for r in rows] == [("work", a.id), ("home", b.id), ("work", b.id), ("home", c.id)]
+
+    svc.update_task(a.id, schemas.TaskUpdate(tags=["home"]))
+    assert [t.id for t in svc.list_tasks(tag="work")] == [b.id]
+    svc.delete_task(b.id)
+    assert sorted(t.id for t in svc.list_tasks(tag="home")) == [a.id, c.id]
+
+
+def test_tag_table_migrated_from_json(tmp_path):
+    import sqlite3
+
+    path = tmp_path / "legacy.sqlite3"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE task (title VARCHAR NOT NULL, description VARCHAR, due_at DATETIME, "
+        "priority VARCHAR NOT NULL, tags JSON, done BOOLEAN NOT NULL, id INTEGER NOT NULL, "
+        "created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL, PRIMARY KEY (id))"
+    )
+    conn.execute(
+        "INSERT INTO task VALUES ('old', NULL, NULL, 'normal', '[\"legacy\"]', 0, 1, "
+        "'2025-01-01 00:00:00', '2025-01-01 00:00:00')"
+    )
+    conn.commit()
+    conn.close()
+
+    url = f"sqlite:///{path}"
+    init_db(get_engine(url))
+    svc = TodoService(session_factory=lambda: get_session(url))
+    assert [t.title for t in svc.list_tasks(tag="legacy")] == ["old"]
+    assert [t.title for t in svc.list_tasks(q="old")] == ["old"]
+
+
+def test_db_pagination_and_iter(svc: TodoService):
+    ids = [svc.create_task(schemas.TaskCreate(title=f"t{i}", tags=["x"] if i % 2 else [])).id for i in range(6)]
+
+    page = svc.list_tasks(limit=2, after_id=ids[1])
+    assert [t.id for t in page] == ids[2:4]
+    assert [t.id for t in svc.list_tasks(tag="x", limit=2, after_id=ids[1])] == [ids[3], ids[5]]
+    assert [t.id for t in svc.iter_tasks(batch_size=2)] == ids
+    assert [t.id for t in svc.iter_tasks(after_id=ids[3], limit=1)] == [ids[4]]
+
+
+def test_db_bulk_operations(svc: TodoService):
+    created = svc.create_tasks([schemas.TaskCreate(title=f"t{i}", tags=["bulk"]) for i in range(3)])
+    ids = [r.id for r in created]
+    assert all(r.ok for r in created) and len(set(ids)) == 3
+    assert sorted(t.id for t in svc.list_tasks(tag="bulk")) == sorted(ids)
+
+    updated = svc.update_tasks(
+        [schemas.TaskBulkUpdate(id=ids[0], title="renamed"), schemas.TaskBulkUpdate(id=-1, done=True)]
+    )
+    assert [r.ok for r in updated] == [True, False]
+    assert svc.get_task(ids[0]).title == "renamed"
+    assert [t.id for t in svc.list_tasks(q="renamed")] == [ids[0]]
+
+    deleted = svc.delete_tasks([ids[1], ids[1], -1])
+    assert [r.ok for r in deleted] == [True, False, False]
+    assert sorted(t.id for t in svc.list_tasks()) == [ids[0], ids[2]]
+
+
+def test_engine_profile_pragmas(tmp_path, monkeypatch):
+    monkeypatch.setenv("DB_SYNCHRONOUS", "OFF")
+    profile = EngineProfile.from_env()
+    assert profile.synchronous is None and profile.journal_mode == "WAL"
+
+    engine = get_engine(f"sqlite:///{tmp_path / 'p.sqlite3'}", EngineProfile(busy_timeout_ms=1234))
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+        assert conn.exec_driver_sql("PRAGMA busy_timeout").scalar() == 1234
+
+    legacy = get_engine(f"sqlite:///{tmp_path / 'l.sqlite3'}", EngineProfile.legacy())
+    with legacy.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "delete"
+
+
+def test_async_service_db(db_url: str, svc: TodoService):
+    import asyncio
+
+    from src.app.async_services import AsyncTodoService
+    from src.app.db import get_async_session
+
+    pytest.importorskip("aiosqlite")
+    asvc = AsyncTodoService(svc, session_factory=lambda: get_async_session(db_url))
+
+    async def flow():
+        a = await asvc.create_task(schemas.TaskCreate(title="async report", tags=["x"]))
+        await asvc.create_task(schemas.TaskCreate(title="other"))
+        assert [t.id for t in await asvc.list_tasks(tag="x")] == [a.id]
+        assert [t.id for t in await asvc.list_tasks(q="report")] == [a.id]
+        assert (await asvc.update_task(a.id, schemas.TaskUpdate(done=True))).done is True
+        assert [t.title async for t in asvc.iter_tasks(batch_size=1)] == ["async report", "other"]
+        assert await asvc.delete_task(a.id) is True
+        assert await asvc.get_task(a.id) is None
+
+    asyncio.run(flow())
+    assert [t.title for t in svc.list_tasks()] == ["other"]
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from src.app import schemas
+from src.app.services import TodoService
+
+
+def make_service() -> TodoService:
+    return TodoService(use_memory=True)
+
+
+def test_memory_filters_use_indexes():
+    svc = make_service()
+    a = svc.create_task(schemas.TaskCreate(title="a", tags=["work"], due_at=datetime(2025, 1, 1)))
+    b = svc.create_task(schemas.TaskCreate(title="b", tags=["work", "home"], due_at=datetime(2025, 1, 5)))
+    c = svc.create_task(schemas.TaskCreate(title="c", tags=["home"]))
+
+    assert [t.id for t in svc.list_tasks(tag="work")] == [a.id, b.id]
+    assert [t.id for t in svc.list_tasks(tag="home", done=False)] == [b.id, c.id]
+    assert [t.id for t in svc.list_tasks(from_dt=datetime(2025, 1, 2))] == [b.id]
+    assert [t.id for t in svc.list_tasks(to_dt=datetime(2025, 1, 5))] == [a.id, b.id]
+    assert svc.list_tasks(tag="missing") == []
+
+    # 更新・削除でインデックスが追従する
+    svc.update_task(a.id, schemas.TaskUpdate(done=True, tags=["home"], due_at=None))
+    assert [t.id for t in svc.list_tasks(done=True)] == [a.id]
+    assert [t.id for t in svc.list_tasks(tag="work")] == [b.id]
+    assert [t.id for t in svc.list_tasks(from_dt=datetime(2024, 1, 1))] == [b.id]
+
+    svc.delete_task(b.id)
+    assert [t.id for t in svc.list_tasks(tag="home")] == [a.id, c.id]
+    assert svc.list_tasks(from_dt=datetime(2024, 1, 1)) == []
+
+
+def test_memory_text_search_with_rank():
+    svc = make_service()
+    a = svc.create_task(schemas.TaskCreate(title="write report", description="quarterly"))
+    b = svc.create_task(schemas.TaskCreate(title="Report review", description="report draft report"))
+    svc.create_task(schemas.TaskCreate(title="牛乳を買う"))
+
+    assert [t.id for t in svc.list_tasks(q="REPORT")] == [a.id, b.id]
+    assert [t.id for t in svc.list_tasks(q="report", rank=True)] == [b.id, a.id]
+    assert [t.title for t in svc.list_tasks(q="牛乳")] == ["牛乳を買う"]
+    assert [t.id for t in svc.list_tasks(q="quarter")] == [a.id]
+
+    svc.update_task(a.id, schemas.TaskUpdate(title="write summary", description=None))
+    assert [t.id for t in svc.list_tasks(q="report")] == [b.id]
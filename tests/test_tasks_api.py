@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 from fastapi.testclient import TestClient
 
 from src.app.main import create_app
@@ -46,3 +48,55 @@ def test_tasks_crud_flow():
     res = client.get(f"/tasks/{tid}")
     assert res.status_code == 404
 
+
+
+def test_tasks_keyset_pagination_and_stream():
+    client = make_client()
+    for i in range(5):
+        client.post("/tasks/", json={"title": f"t{i}", "done": i % 2 == 0})
+
+    res = client.get("/tasks/", params={"limit": 2})
+    assert [t["title"] for t in res.json()] == ["t0", "t1"]
+    cursor = res.headers["X-Next-After-Id"]
+
+    res = client.get("/tasks/", params={"limit": 2, "after_id": cursor, "done": True})
+    assert [t["title"] for t in res.json()] == ["t2", "t4"]
+
+    res = client.get("/tasks/", params={"limit": 10, "after_id": 4})
+    assert [t["title"] for t in res.json()] == ["t4"]
+    assert "X-Next-After-Id" not in res.headers
+
+    res = client.get("/tasks/stream", params={"after_id": 1})
+    assert res.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in res.text.splitlines()]
+    assert [t["title"] for t in lines] == ["t1", "t2", "t3", "t4"]
+
+
+def test_tasks_bulk_endpoints():
+    client = make_client()
+
+    res = client.post("/tasks/bulk", json=[{"title": "a"}, {"priority": "high"}, {"title": "c", "tags": ["x"]}])
+    assert res.status_code == 200, res.text
+    results = res.json()
+    assert [r["ok"] for r in results] == [True, False, True]
+    assert results[1]["index"] == 1 and results[1]["error"]
+    a_id, c_id = results[0]["id"], results[2]["id"]
+
+    res = client.patch("/tasks/bulk", json=[{"id": a_id, "done": True}, {"id": 999, "done": True}])
+    assert [r["ok"] for r in res.json()] == [True, False]
+    assert client.get(f"/tasks/{a_id}").json()["done"] is True
+
+    res = client.request("DELETE", "/tasks/bulk", json=[a_id, c_id, 999])
+    assert [r["ok"] for r in res.json()] == [True, True, False]
+    assert client.get("/tasks/").json() == []
+
+
+def test_tasks_async_routes_memory():
+    client = TestClient(create_app(use_memory=True, use_async=True))
+    tid = client.post("/tasks/", json={"title": "async"}).json()["id"]
+    assert client.get(f"/tasks/{tid}").json()["title"] == "async"
+    assert client.patch(f"/tasks/{tid}", json={"done": True}).json()["done"] is True
+    assert [t["id"] for t in client.get("/tasks/", params={"done": True}).json()] == [tid]
+    assert client.post("/tasks/bulk", json=[{"title": "b"}]).json()[0]["ok"] is True
+    assert len(client.get("/tasks/stream").text.splitlines()) == 2
+    assert client.delete(f"/tasks/{tid}").status_code == 204